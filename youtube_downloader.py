@@ -7,88 +7,257 @@ Downloads all videos from a YouTube channel and converts them to audio files.
 import os
 import sys
 import argparse
+import atexit
+import gzip
+import io
 import re
+import functools
+import shutil
+import time
+import urllib.parse
 from pathlib import Path
 import yt_dlp
-from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import curl_cffi  # noqa: F401 - enables yt-dlp's impersonation backend
+    from yt_dlp.networking.impersonate import ImpersonateTarget
+except ImportError:
+    ImpersonateTarget = None
+
+# Rate limit strings like: 1M, 500K, 2G, etc.
+_RATE_RE = re.compile(r'^(\d+(?:\.\d+)?)\s*([KMGT]?)B?$')
+_MULT = {'': 1, 'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30, 'T': 1 << 40}
+
+# YouTube hosts, including subdomains such as www. and m.
+_YT_RE = re.compile(r'(?:^|\.)(?:youtube\.com|youtu\.be)$')
+
+# yt-dlp's error when the requested impersonation target has no backend
+_IMPERSONATE_UNAVAILABLE_RE = re.compile(r'Impersonate target ".*" is not available')
+
+# Network options shared by every YoutubeDL; with curl_cffi installed requests
+# go through its pooled HTTP/2 connections instead of plain urllib
+_NETWORK_OPTS = {}
+if ImpersonateTarget is not None:
+    _NETWORK_OPTS['impersonate'] = ImpersonateTarget('chrome')
+
+# Channel tab suffixes stripped to get the base channel URL
+_SUFFIX_RE = re.compile(r'/(videos|live|streams|shorts)/?$')
+
+# --video-types choice -> (channel URL suffix, label); the base URL gets all types
+_VIDEO_TYPES = {
+    'all': ('', 'ALL video types'),
+    'videos': ('/videos', 'REGULAR VIDEOS'),
+    'shorts': ('/shorts', 'SHORTS'),
+    'streams': ('/streams', 'LIVE STREAMS'),
+}
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that batches records in a 64 KiB buffer instead of flushing each one
+    
+    The buffer is still flushed once flush_interval seconds have passed since
+    the last flush, so a long run keeps the log file reasonably current.
+    """
+    
+    flush_interval = 5.0
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_flush = time.monotonic()
+    
+    def flush(self):
+        super().flush()
+        self._last_flush = time.monotonic()
+    
+    def _open(self):
+        return io.BufferedWriter(io.FileIO(self.baseFilename, 'ab'), buffer_size=65536)
+    
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg.encode(self.encoding or 'utf-8'))
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+class _ExtractAudioKeepVideoPP(yt_dlp.postprocessor.FFmpegExtractAudioPP):
+    """Extract audio without deleting the source video
+    
+    keepvideo then only decides whether the separate streams of a merged
+    format are kept.
+    """
+    
+    @classmethod
+    def pp_key(cls):
+        # Report as the stock ExtractAudio so hooks and postprocessor_args match
+        return 'ExtractAudio'
+    
+    def run(self, information):
+        video_path = information['filepath']
+        _, information = super().run(information)
+        # Skipped conversions leave filepath on the video; flag real extractions
+        information['__audio_extracted'] = information['filepath'] != video_path
+        return [], information
+
+class _MoveToAudioDirPP(yt_dlp.postprocessor.PostProcessor):
+    """Move audio extracted next to a kept video into the audio folder
+    
+    Only files flagged by _ExtractAudioKeepVideoPP are moved, so a video
+    whose extraction was skipped stays in the videos folder.
+    """
+    
+    def __init__(self, audio_dir, downloader=None):
+        super().__init__(downloader)
+        self.audio_dir = audio_dir
+    
+    def run(self, info):
+        filepath = info.get('filepath')
+        if info.get('__audio_extracted') and filepath and os.path.exists(filepath):
+            dest = os.path.join(self.audio_dir, os.path.basename(filepath))
+            os.replace(filepath, dest)
+            info['filepath'] = dest
+        return [], info
+
+class _GzipInfoJsonPP(yt_dlp.postprocessor.PostProcessor):
+    """Replace the written .info.json with a fast-level gzip copy"""
+    
+    def run(self, info):
+        infojson = info.get('infojson_filename')
+        if infojson and os.path.exists(infojson):
+            with open(infojson, 'rb') as src, gzip.open(infojson + '.gz', 'wb', compresslevel=1) as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(infojson)
+            info['infojson_filename'] = infojson + '.gz'
+        return [], info
+
+def _build_ydl(opts, audio_dir=None):
+    """Create a YoutubeDL, moving extracted audio into audio_dir when given"""
+    try:
+        ydl = yt_dlp.YoutubeDL(opts)
+    except yt_dlp.utils.YoutubeDLError as e:
+        if 'impersonate' not in opts or not _IMPERSONATE_UNAVAILABLE_RE.search(str(e)):
+            raise
+        # The installed curl_cffi is not one yt-dlp supports; stop asking for it
+        print("⚠️  curl_cffi impersonation is not available, using default networking")
+        _NETWORK_OPTS.pop('impersonate', None)
+        opts = {key: value for key, value in opts.items() if key != 'impersonate'}
+        ydl = yt_dlp.YoutubeDL(opts)
+    if opts.get('writeinfojson'):
+        ydl.add_post_processor(_GzipInfoJsonPP())
+    if audio_dir:
+        ydl.add_post_processor(_MoveToAudioDirPP(audio_dir), when='after_move')
+    return ydl
+
+def _progress_hook(state, log_error, d):
+    """yt-dlp progress and postprocessor hook; bind state and log_error with functools.partial
+    
+    state is a dict with the 'ok' and 'fail' counters and the 'label' shown
+    in progress lines; log_error is called with the message of each failed
+    download. A video counts as processed once FFmpegExtractAudio finishes,
+    so merged formats (one download per stream) are only counted once.
+    """
+    try:
+        if 'postprocessor' in d:
+            if d['postprocessor'] != 'ExtractAudio' or d['status'] != 'finished':
+                return
+            state['ok'] += 1
+            filename = d.get('info_dict', {}).get('filepath', 'Unknown')
+            # Extract just the filename from the path
+            filename = os.path.basename(filename) if filename != 'Unknown' else filename
+            print(f"✅ Audio extracted: {filename}")
+            print(f"📈 Progress ({state['label']}): Success: {state['ok']}, Failed: {state['fail']}")
+        elif d['status'] == 'error':
+            state['fail'] += 1
+            error_msg = f"Failed to extract audio: {d.get('filename', 'Unknown')}"
+            log_error(error_msg)
+            print(f"📈 Progress ({state['label']}): Success: {state['ok']}, Failed: {state['fail']}")
+    except Exception:
+        # Ignore hook errors to prevent crashes
+        pass
+
 class YouTubeDownloader:
     def __init__(self, output_dir="downloads", audio_format="mp3", quality="best"):
         self.output_dir = Path(output_dir)
         self.audio_format = audio_format
         self.quality = quality
-        self.output_dir.mkdir(exist_ok=True)
+        self.no_subs = False
+        self.no_metadata = False
+        self.keep_video = False
+        
+        # Create subdirectories (and the output directory with them)
+        for sub in ("videos", "audio"):
+            (self.output_dir / sub).mkdir(parents=True, exist_ok=True)
         
-        # Create subdirectories
-        (self.output_dir / "videos").mkdir(exist_ok=True)
-        (self.output_dir / "audio").mkdir(exist_ok=True)
+        # Output filename templates shared by channel and single video downloads
+        self._video_outtmpl = str(self.output_dir / 'videos' / '%(uploader)s - [%(upload_date)s] %(title)s.%(ext)s')
+        self._audio_outtmpl = str(self.output_dir / 'audio' / '%(uploader)s - [%(upload_date)s] %(title)s.%(ext)s')
         
         # Setup error logging
         self.error_log_file = self.output_dir / "error_log.txt"
         self.setup_logging()
         
+        # Long-lived yt-dlp instances for single videos, keyed by their
+        # options and built on first use so connection pools are reused
+        self._ydls = {}
+        self._video_title = "Unknown"
+        
     def setup_logging(self):
         """Setup logging to file"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.error_log_file),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        
+        # Attach the file handler to a logger owned by this instance so each
+        # downloader writes to its own error_log.txt even when the root
+        # logger is already configured (where basicConfig does nothing)
+        self._log_handler = _BufferedFileHandler(self.error_log_file, encoding='utf-8')
+        self._log_handler.setFormatter(logging.Formatter(log_format))
+        atexit.register(self._log_handler.flush)
+        self.logger = logging.getLogger(f"{__name__}.{id(self)}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(self._log_handler)
+        
+        # Status lines are printed; the console only mirrors warnings and errors
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.WARNING)
+        logging.basicConfig(level=logging.INFO, format=log_format, handlers=[console_handler])
         
         # Write session start
-        with open(self.error_log_file, 'a') as f:
-            f.write(f"\n{'='*50}\n")
-            f.write(f"Session started: {datetime.now()}\n")
-            f.write(f"{'='*50}\n")
+        self.logger.info('=' * 50)
+        self.logger.info(f"Session started: {datetime.now()}")
+        self.logger.info('=' * 50)
     
     def log_error(self, error_msg, video_url=None):
-        """Log error to file"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        error_entry = f"[{timestamp}] ERROR: {error_msg}"
+        """Log error to the error log file and the console"""
         if video_url:
-            error_entry += f" | URL: {video_url}"
-        error_entry += "\n"
-        
-        with open(self.error_log_file, 'a') as f:
-            f.write(error_entry)
+            self.logger.error("%s | URL: %s", error_msg, video_url)
+        else:
+            self.logger.error("%s", error_msg)
     
-    def parse_rate_limit(self, rate_limit_str):
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def parse_rate_limit(rate_limit_str):
         """Parse rate limit string and convert to bytes per second"""
         if not rate_limit_str:
             return None
         
+        # Remove any whitespace and convert to uppercase
+        m = _RATE_RE.match(rate_limit_str.strip().upper())
+        if not m:
+            return None
+        
         try:
-            # Remove any whitespace and convert to uppercase
-            rate_limit_str = rate_limit_str.strip().upper()
-            
-            # Match pattern like: 1M, 500K, 2G, etc.
-            pattern = r'^(\d+(?:\.\d+)?)\s*([KMGT]?)B?$'
-            match = re.match(pattern, rate_limit_str)
-            if not match:
-                return None
-            
-            number = float(match.group(1))
-            unit = match.group(2)
-            
-            # Convert to bytes
-            multipliers = {
-                '': 1,
-                'K': 1024,
-                'M': 1024 * 1024,
-                'G': 1024 * 1024 * 1024,
-                'T': 1024 * 1024 * 1024 * 1024
-            }
-            
-            return int(number * multipliers.get(unit, 1))
-            
-        except Exception:
+            return int(float(m[1]) * _MULT[m[2]])
+        except (OverflowError, ValueError):
+            # Absurdly long numbers overflow to inf, which int() rejects
             return None
     
     def download_channel_direct(self, channel_url, download_videos=True, max_workers=2, video_types='all', 
@@ -97,47 +266,31 @@ class YouTubeDownloader:
         """Download all videos from a channel using direct yt-dlp channel processing"""
         print(f"🔍 Processing channel directly with yt-dlp: {channel_url}")
         
-        # Determine URLs to download based on video types
-        urls_to_process = []
-        
         # Clean base URL
-        clean_url = channel_url
-        if clean_url.endswith('/videos'):
-            clean_url = clean_url[:-7]
-        if clean_url.endswith('/live'):
-            clean_url = clean_url[:-5]
-        if clean_url.endswith('/streams'):
-            clean_url = clean_url[:-8]
-        if clean_url.endswith('/shorts'):
-            clean_url = clean_url[:-7]
+        clean_url = _SUFFIX_RE.sub('', channel_url)
         
-        if video_types == 'all':
-            urls_to_process = [clean_url]  # Base URL gets all types
-            print(f"🎯 Downloading ALL video types from: {clean_url}")
-        elif video_types == 'videos':
-            urls_to_process = [f"{clean_url}/videos"]
-            print(f"🎯 Downloading REGULAR VIDEOS from: {clean_url}/videos")
-        elif video_types == 'shorts':
-            urls_to_process = [f"{clean_url}/shorts"]
-            print(f"🎯 Downloading SHORTS from: {clean_url}/shorts")
-        elif video_types == 'streams':
-            urls_to_process = [f"{clean_url}/streams"]
-            print(f"🎯 Downloading LIVE STREAMS from: {clean_url}/streams")
+        # Determine URLs to download based on video types
+        urls_to_process = []
+        if video_types in _VIDEO_TYPES:
+            suffix, label = _VIDEO_TYPES[video_types]
+            urls_to_process = [clean_url + suffix]
+            print(f"🎯 Downloading {label} from: {urls_to_process[0]}")
         
         # Common yt-dlp options with rate limiting
         base_opts = {
             'extract_flat': False,  # We want full video info
-            'writeinfojson': not getattr(self, 'no_metadata', False),
-            'writesubtitles': not getattr(self, 'no_subs', False),
-            'writeautomaticsub': not getattr(self, 'no_subs', False),
-            'subtitleslangs': ['en'] if not getattr(self, 'no_subs', False) else [],
+            'writeinfojson': not self.no_metadata,
+            'writesubtitles': not self.no_subs,
+            'writeautomaticsub': not self.no_subs,
+            'subtitleslangs': ['en'] if not self.no_subs else [],
             'ignoreerrors': True,  # Continue on errors
             'no_warnings': False,
             'playlistend': max_downloads,  # Limit number of downloads
-            'keepvideo': getattr(self, 'keep_video', False),
+            'keepvideo': self.keep_video,
             'no_color': True,
             'continue_dl': True,
             'retries': 3,
+            **_NETWORK_OPTS,
         }
         
         # Add rate limiting options
@@ -174,113 +327,112 @@ class YouTubeDownloader:
         failed = 0
         total_downloaded = 0
         
+        if download_videos:
+            # Download the video once and extract audio from it locally; the
+            # video is kept in videos/ and the audio is moved into audio/.
+            # 'best' alone would resolve to a progressive format whose audio
+            # track is worse than bestaudio, so always merge in bestaudio.
+            # Other quality selectors keep their own audio when they pick a
+            # progressive format (yt-dlp drops the second audio stream).
+            video_format = 'bestvideo*' if self.quality == 'best' else self.quality
+            base_opts = {
+                **base_opts,
+                'format': f"{video_format}+bestaudio/best",
+                'outtmpl': self._video_outtmpl,
+            }
+        else:
+            base_opts = {
+                **base_opts,
+                'format': 'bestaudio/best',
+                'outtmpl': self._audio_outtmpl,
+                'postprocessors': [{
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': self.audio_format,
+                    'preferredquality': '192',
+                }],
+            }
+        
+        # Hooks are only read when YoutubeDL is created, so register one for
+        # the whole run and relabel it per URL through the shared state
+        progress = {'ok': 0, 'fail': 0, 'label': 'all'}
+        hook = functools.partial(_progress_hook, progress, self.log_error)
+        base_opts['progress_hooks'] = [hook]
+        base_opts['postprocessor_hooks'] = [hook]
+        
+        # One long-lived instance for every URL so the HTTP connection pool,
+        # cookie jar and extractor caches survive between downloads
+        audio_dir = str(self.output_dir / 'audio') if download_videos else None
+        self._ydl = _build_ydl(base_opts, audio_dir)
+        if download_videos:
+            # The merged video stays in videos/ even without --keep-video
+            self._ydl.add_post_processor(
+                _ExtractAudioKeepVideoPP(preferredcodec=self.audio_format, preferredquality='192'))
         try:
+            # Fetch the flat channel listing once up front; it is reused for
+            # the summary count and for channel_info.json. The listing covers
+            # the whole channel and must not write any sidecar files.
+            channel_listings = {}
+            listing_opts = {
+                'extract_flat': True,
+                'quiet': True,
+                'playlistend': None,
+                'writeinfojson': False,
+                'simulate': True,
+            }
+            saved_opts = {key: self._ydl.params.get(key) for key in listing_opts}
+            self._ydl.params.update(listing_opts)
+            try:
+                for url in urls_to_process:
+                    try:
+                        channel_listings[url] = self._ydl.extract_info(url, download=False)
+                    except Exception as e:
+                        self.log_error(f"Could not extract channel info: {e}", url)
+            finally:
+                self._ydl.params.update(saved_opts)
+            
             # Process each URL type
             for url in urls_to_process:
                 print(f"\n🚀 Processing: {url}")
                 
                 if download_videos:
-                    # Download videos
-                    video_opts = base_opts.copy()
-                    video_opts.update({
-                        'format': self.quality,
-                        'outtmpl': str(self.output_dir / 'videos' / '%(uploader)s - [%(upload_date)s] %(title)s.%(ext)s'),
-                    })
-                    
-                    print(f"📹 Downloading videos...")
-                    with yt_dlp.YoutubeDL(video_opts) as ydl:
-                        try:
-                            ydl.download([url])
-                            print(f"✅ Video downloads completed for {url}")
-                        except Exception as e:
-                            error_msg = f"Error downloading videos from {url}: {e}"
-                            print(f"❌ {error_msg}")
-                            self.log_error(error_msg, url)
-                
-                # Download and convert to audio
-                audio_opts = base_opts.copy()
-                audio_opts.update({
-                    'format': 'bestaudio/best',
-                    'outtmpl': str(self.output_dir / 'audio' / '%(uploader)s - [%(upload_date)s] %(title)s.%(ext)s'),
-                    'postprocessors': [{
-                        'key': 'FFmpegExtractAudio',
-                        'preferredcodec': self.audio_format,
-                        'preferredquality': '192',
-                    }],
-                })
-                
-                print(f"🎵 Extracting audio from: {url}")
+                    print(f"📹 Downloading videos and extracting audio from: {url}")
+                else:
+                    print(f"🎵 Extracting audio from: {url}")
                 
-                class ProgressHook:
-                    def __init__(self, parent, url_label):
-                        self.parent = parent
-                        self.successful = 0
-                        self.failed = 0
-                        self.url_label = url_label
-                    
-                    def __call__(self, d):
-                        try:
-                            if d['status'] == 'finished':
-                                self.successful += 1
-                                filename = d.get('filename', 'Unknown')
-                                # Extract just the filename from the path
-                                if filename != 'Unknown':
-                                    filename = filename.split('\\')[-1].split('/')[-1]
-                                print(f"✅ Audio extracted: {filename}")
-                                print(f"📈 Progress ({self.url_label}): Success: {self.successful}, Failed: {self.failed}")
-                            elif d['status'] == 'error':
-                                self.failed += 1
-                                error_msg = f"Failed to extract audio: {d.get('filename', 'Unknown')}"
-                                print(f"❌ {error_msg}")
-                                self.parent.log_error(error_msg)
-                                print(f"📈 Progress ({self.url_label}): Success: {self.successful}, Failed: {self.failed}")
-                        except Exception as e:
-                            # Ignore hook errors to prevent crashes
-                            pass
-                
-                progress_hook = ProgressHook(self, url.split('/')[-1] or 'all')
-                audio_opts['progress_hooks'] = [progress_hook]
-                
-                with yt_dlp.YoutubeDL(audio_opts) as ydl:
-                    try:
-                        ydl.download([url])
-                        successful += progress_hook.successful
-                        failed += progress_hook.failed
-                        print(f"✅ Audio extraction completed for {url}")
-                    except Exception as e:
-                        error_msg = f"Error during audio extraction from {url}: {e}"
-                        print(f"❌ {error_msg}")
-                        self.log_error(error_msg, url)
-                        failed += 1
+                progress['label'] = url.split('/')[-1] or 'all'
+                try:
+                    self._ydl.download([url])
+                    print(f"✅ Downloads completed for {url}")
+                except Exception as e:
+                    progress['fail'] += 1
+                    self.log_error(f"Error downloading from {url}: {e}", url)
+            
+            successful = progress['ok']
+            failed = progress['fail']
             
             # Get channel info for summary
             try:
-                info_opts = {
-                    'extract_flat': True,
-                    'quiet': True,
-                }
-                with yt_dlp.YoutubeDL(info_opts) as ydl:
-                    for url in urls_to_process:
-                        try:
-                            channel_info = ydl.extract_info(url, download=False)
-                            if channel_info and 'entries' in channel_info:
-                                total_downloaded += len([e for e in channel_info['entries'] if e])
-                        except:
-                            pass  # Skip if can't get info
-                    
-                    # Save channel info for the main URL
-                    if urls_to_process:
-                        main_info = ydl.extract_info(urls_to_process[0], download=False)
+                for channel_info in channel_listings.values():
+                    if channel_info and 'entries' in channel_info:
+                        total_downloaded += len([e for e in channel_info['entries'] if e])
+                
+                # Save channel info for the main URL
+                main_info = channel_listings.get(urls_to_process[0]) if urls_to_process else None
+                if main_info:
+                    if orjson is not None:
+                        with open(self.output_dir / 'channel_info.json', 'wb') as f:
+                            f.write(orjson.dumps(main_info, option=orjson.OPT_INDENT_2))
+                    else:
                         with open(self.output_dir / 'channel_info.json', 'w') as f:
                             json.dump(main_info, f, indent=2)
-                            
+                        
             except Exception as e:
                 self.log_error(f"Could not extract channel info: {e}")
-        
         except Exception as e:
             error_msg = f"Critical error during channel download: {e}"
-            print(f"❌ {error_msg}")
             self.log_error(error_msg, str(urls_to_process))
+        finally:
+            self._ydl.close()
         
         print(f"\n🏁 Download complete!")
         print(f"✅ Successfully processed: {successful}")
@@ -290,92 +442,88 @@ class YouTubeDownloader:
         print(f"📋 Error log saved to: {self.error_log_file.absolute()}")
         
         # Write summary to error log
-        with open(self.error_log_file, 'a') as f:
-            f.write(f"\nSession Summary:\n")
-            f.write(f"URLs processed: {urls_to_process}\n")
-            f.write(f"Video types: {video_types}\n")
-            f.write(f"Total videos found: {total_downloaded}\n")
-            f.write(f"Successfully processed: {successful}\n")
-            f.write(f"Failed: {failed}\n")
-            f.write(f"Rate limiting: sleep={sleep_interval}s, max_sleep={max_sleep_interval}s, rate_limit={rate_limit}\n")
-            f.write(f"Session ended: {datetime.now()}\n")
+        self.logger.info("Session Summary:")
+        self.logger.info(f"URLs processed: {urls_to_process}")
+        self.logger.info(f"Video types: {video_types}")
+        self.logger.info(f"Total videos found: {total_downloaded}")
+        self.logger.info(f"Successfully processed: {successful}")
+        self.logger.info(f"Failed: {failed}")
+        self.logger.info(f"Rate limiting: sleep={sleep_interval}s, max_sleep={max_sleep_interval}s, rate_limit={rate_limit}")
+        self.logger.info(f"Session ended: {datetime.now()}")
+        self._log_handler.flush()
+    
+    def _capture_title(self, d):
+        """Progress hook that records the title of the video being downloaded"""
+        # Any status will do: an already downloaded file only reports 'finished'
+        if self._video_title == "Unknown":
+            self._video_title = d.get('info_dict', {}).get('title', 'Unknown')
+    
+    def _get_ydl(self, opts):
+        """Return the cached YoutubeDL for these options, building it on first use"""
+        key = repr(sorted(opts.items()))
+        ydl = self._ydls.get(key)
+        if ydl is None:
+            ydl = self._ydls[key] = _build_ydl(opts)
+        return ydl
+    
+    def close(self):
+        """Close the cached single-video YoutubeDL instances"""
+        for ydl in self._ydls.values():
+            ydl.close()
+        self._ydls.clear()
     
     def download_video(self, video_url, download_video=True):
         """Download a single video and convert to audio"""
-        video_title = "Unknown"
+        self._video_title = "Unknown"
         
         try:
-            # Check if the video is available
-            check_opts = {
-                'quiet': True,
-                'no_warnings': True,
-                'extract_flat': False,
-            }
-            
-            with yt_dlp.YoutubeDL(check_opts) as ydl:
-                try:
-                    info = ydl.extract_info(video_url, download=False)
-                    video_title = info.get('title', 'Unknown')
-                    
-                    if not info:
-                        error_msg = f"Video not available: {video_title}"
-                        print(f"❌ {error_msg}")
-                        self.log_error(error_msg, video_url)
-                        return False
-                        
-                except Exception as e:
-                    error_msg = f"Error checking video availability: {e}"
-                    print(f"❌ {error_msg}")
-                    self.log_error(error_msg, video_url)
-                    return False
-            
             # Common options
             base_opts = {
                 'format': self.quality,
-                'outtmpl': str(self.output_dir / 'videos' / '%(title)s.%(ext)s'),
-                'writeinfojson': not getattr(self, 'no_metadata', False),
-                'writesubtitles': not getattr(self, 'no_subs', False),
-                'writeautomaticsub': not getattr(self, 'no_subs', False),
-                'subtitleslangs': ['en'] if not getattr(self, 'no_subs', False) else [],
+                'outtmpl': self._video_outtmpl,
+                'writeinfojson': not self.no_metadata,
+                'writesubtitles': not self.no_subs,
+                'writeautomaticsub': not self.no_subs,
+                'subtitleslangs': ['en'] if not self.no_subs else [],
                 'ignoreerrors': False,
                 'no_warnings': True,
-                'keepvideo': getattr(self, 'keep_video', False),
+                'keepvideo': self.keep_video,
+                'progress_hooks': [self._capture_title],
+                **_NETWORK_OPTS,
             }
             
             # Download video if requested
             if download_video:
-                print(f"📹 Downloading video: {video_title}")
+                print(f"📹 Downloading video: {video_url}")
                 try:
-                    with yt_dlp.YoutubeDL(base_opts) as ydl:
-                        ydl.download([video_url])
+                    self._get_ydl(base_opts).download([video_url])
                 except Exception as e:
-                    error_msg = f"Failed to download video '{video_title}': {e}"
-                    print(f"❌ {error_msg}")
+                    error_msg = f"Failed to download video '{self._video_title}': {e}"
                     self.log_error(error_msg, video_url)
                     # Continue to try audio extraction
             
             # Download and convert to audio
-            audio_opts = base_opts.copy()
-            audio_opts.update({
+            audio_opts = {
+                **base_opts,
                 'format': 'bestaudio/best',
-                'outtmpl': str(self.output_dir / 'audio' / '%(title)s.%(ext)s'),
+                'outtmpl': self._audio_outtmpl,
+                # The video pass already wrote the metadata
+                'writeinfojson': base_opts['writeinfojson'] and not download_video,
                 'postprocessors': [{
                     'key': 'FFmpegExtractAudio',
                     'preferredcodec': self.audio_format,
                     'preferredquality': '192',
                 }],
-            })
+            }
             
-            print(f"🎵 Extracting audio: {video_title}")
-            with yt_dlp.YoutubeDL(audio_opts) as ydl:
-                ydl.download([video_url])
+            print(f"🎵 Extracting audio: {video_url}")
+            self._get_ydl(audio_opts).download([video_url])
             
-            print(f"✅ Successfully processed: {video_title}")
+            print(f"✅ Successfully processed: {self._video_title}")
             return True
             
         except Exception as e:
-            error_msg = f"Error processing '{video_title}': {e}"
-            print(f"❌ {error_msg}")
+            error_msg = f"Error processing '{self._video_title}': {e}"
             self.log_error(error_msg, video_url)
             return False
 
@@ -403,17 +551,17 @@ def main():
     args = parser.parse_args()
     
     # Check if ffmpeg is available
-    try:
-        import subprocess
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True, text=True)
+    if shutil.which('ffmpeg') is not None:
         print("✅ ffmpeg is available")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    else:
         print("⚠️  Warning: ffmpeg not found. Audio conversion may not work.")
         print("📥 Install ffmpeg: https://ffmpeg.org/download.html")
         return
     
     # Validate URL
-    if not ('youtube.com' in args.url or 'youtu.be' in args.url):
+    # Allow scheme-less URLs such as youtube.com/@name
+    url_host = urllib.parse.urlparse(args.url if '//' in args.url else '//' + args.url).hostname
+    if not _YT_RE.search(url_host or ''):
         print("❌ Please provide a valid YouTube URL")
         return
     
@@ -429,28 +577,31 @@ def main():
     downloader.keep_video = args.keep_video
     
     # Detect if it's a channel or single video
-    if any(x in args.url for x in ['channel', 'user', '/c/', '/@']):
-        # Use direct channel processing - let yt-dlp handle the channel
-        downloader.download_channel_direct(
-            args.url, 
-            not args.audio_only, 
-            args.workers,
-            args.video_types,
-            args.sleep_interval,
-            args.max_sleep_interval,
-            args.rate_limit,
-            args.max_downloads,
-            args.date_after,
-            args.date_before
-        )
-    else:
-        # Single video
-        print("📹 Downloading single video...")
-        success = downloader.download_video(args.url, not args.audio_only)
-        if success:
-            print("✅ Download completed successfully!")
+    try:
+        if any(x in args.url for x in ['channel', 'user', '/c/', '/@']):
+            # Use direct channel processing - let yt-dlp handle the channel
+            downloader.download_channel_direct(
+                args.url, 
+                not args.audio_only, 
+                args.workers,
+                args.video_types,
+                args.sleep_interval,
+                args.max_sleep_interval,
+                args.rate_limit,
+                args.max_downloads,
+                args.date_after,
+                args.date_before
+            )
         else:
-            print("❌ Download failed!")
+            # Single video
+            print("📹 Downloading single video...")
+            success = downloader.download_video(args.url, not args.audio_only)
+            if success:
+                print("✅ Download completed successfully!")
+            else:
+                print("❌ Download failed!")
+    finally:
+        downloader.close()
 
 if __name__ == "__main__":
     main()